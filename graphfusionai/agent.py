@@ -1,6 +1,6 @@
 """Base agent implementation with LLM capabilities"""
 
-from typing import List, Dict, Any, Optional, Callable, TypeVar, Union, Type
+from typing import List, Dict, Any, Optional, Callable, TypeVar, Union, Type, FrozenSet
 from pydantic import BaseModel, PrivateAttr
 from uuid import uuid4
 import logging
@@ -26,7 +26,7 @@ class Role(BaseModel):
 
     def validate_capabilities(self, tools: List[str]) -> bool:
         """Validate that all required capabilities are available"""
-        return all(cap in tools for cap in self.capabilities)
+        return frozenset(self.capabilities).issubset(tools)
 
 class Tool(BaseModel):
     """Tool definition for agent capabilities"""
@@ -55,6 +55,7 @@ class Agent(BaseModel):
     _logger: logging.Logger = PrivateAttr()
     _memory: Dict[str, Any] = PrivateAttr(default_factory=dict)
     _tools: Dict[str, Tool] = PrivateAttr(default_factory=dict)
+    _tool_params: Dict[str, FrozenSet[str]] = PrivateAttr(default_factory=dict)
     _active_tasks: Dict[str, asyncio.Task] = PrivateAttr(default_factory=dict)
 
     # LLM-related attributes
@@ -88,6 +89,7 @@ class Agent(BaseModel):
                 return False
                 
             self._tools[tool.name] = tool
+            self._tool_params.pop(tool.name, None)
             self._logger.info(f"Tool registered: {tool.name}")
             return True
         except Exception as e:
@@ -105,15 +107,13 @@ class Agent(BaseModel):
         try:
             yield task_id
         finally:
-            if task_id in self._active_tasks:
-                task = self._active_tasks[task_id]
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-                del self._active_tasks[task_id]
+            task = self._active_tasks.pop(task_id, None)
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
     async def execute_tool(self, tool_name: str, **kwargs) -> Any:
         """Execute a tool with proper error handling and timeout"""
@@ -199,12 +199,26 @@ class Agent(BaseModel):
         # extract the value to pass directly
         if len(data) == 1:
             param_name = next(iter(data))
-            if param_name in inspect.signature(self._tools[tool_name].func).parameters:
+            if param_name in self._get_tool_params(tool_name):
                 data = data[param_name]
                 
         result = await self.execute_tool(tool_name, data=data)
         return result
 
+    def _get_tool_params(self, tool_name: str) -> FrozenSet[str]:
+        """Parameter names of a tool's function, introspected once per tool"""
+        params = self._tool_params.get(tool_name)
+        if params is None:
+            try:
+                params = frozenset(
+                    inspect.signature(self._tools[tool_name].func).parameters
+                )
+            except (TypeError, ValueError):
+                # Some builtins expose no signature; treat them as parameterless
+                params = frozenset()
+            self._tool_params[tool_name] = params
+        return params
+
     async def cleanup(self):
         """Cleanup agent resources"""
         # Cancel all active tasks
@@ -220,6 +234,7 @@ class Agent(BaseModel):
         # Clear memory and tools
         self._memory.clear()
         self._tools.clear()
+        self._tool_params.clear()
         
         # Cleanup LLM resources if present
         if self._llm_provider:
@@ -2,8 +2,11 @@ from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 import asyncio
+import logging
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
+
 class Message(BaseModel):
     """Message structure for agent communication"""
     id: str
@@ -20,11 +23,16 @@ class CommunicationBus:
         self._subscribers = defaultdict(list)
         self._message_queue = asyncio.Queue()
         self._message_history: List[Message] = []
+        # Per-agent history kept up to date on send, so lookups skip the full scan
+        self._history_by_agent: Dict[str, List[Message]] = defaultdict(list)
 
     async def send_message(self, message: Message):
         """Send message to specified receiver"""
         await self._message_queue.put(message)
         self._message_history.append(message)
+        self._history_by_agent[message.sender].append(message)
+        if message.receiver != message.sender:
+            self._history_by_agent[message.receiver].append(message)
 
     async def subscribe(self, agent_id: str, callback):
         """Subscribe agent to receive messages"""
@@ -40,20 +48,17 @@ class CommunicationBus:
             message = await self._message_queue.get()
 
             # Process message
-            receivers = self._subscribers.get(message.receiver, [])
+            receivers = self._subscribers.get(message.receiver, ())
             for callback in receivers:
                 try:
                     await callback(message)
                 except Exception as e:
-                    print(f"Error processing message: {str(e)}")
+                    logger.error("Error processing message %s: %s", message.id, e)
 
             self._message_queue.task_done()
 
     def get_message_history(self, agent_id: Optional[str] = None) -> List[Message]:
         """Get message history for specific agent"""
         if agent_id:
-            return [
-                msg for msg in self._message_history 
-                if msg.sender == agent_id or msg.receiver == agent_id
-            ]
+            return list(self._history_by_agent.get(agent_id, ()))
         return self._message_history
\ No newline at end of file
@@ -6,6 +6,21 @@ import spacy
 from functools import lru_cache
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON with orjson when available, falling back to json for
+    documents orjson rejects (NaN/Infinity literals, integers over 64 bits)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 class Node(BaseModel):
     """Knowledge Graph Node"""
     id: str
@@ -41,6 +56,18 @@ class KnowledgeGraph:
         "causes", "located_in", "occurs_at", "belongs_to"
     }
 
+    # spaCy entity label -> knowledge graph node type
+    SPACY_TYPE_MAPPING = {
+        "PERSON": "person",
+        "ORG": "organization",
+        "GPE": "location",
+        "DATE": "date",
+        "EVENT": "event",
+        "NORP": "concept",
+        "FAC": "location",
+        "PRODUCT": "entity"
+    }
+
     def __init__(self):
         self.graph = nx.MultiDiGraph()
         self.logger = logging.getLogger("KnowledgeGraph")
@@ -112,17 +139,7 @@ class KnowledgeGraph:
 
     def _map_spacy_type_to_node_type(self, spacy_type: str) -> Optional[str]:
         """Map spaCy entity types to knowledge graph node types"""
-        mapping = {
-            "PERSON": "person",
-            "ORG": "organization",
-            "GPE": "location",
-            "DATE": "date",
-            "EVENT": "event",
-            "NORP": "concept",
-            "FAC": "location",
-            "PRODUCT": "entity"
-        }
-        return mapping.get(spacy_type)
+        return self.SPACY_TYPE_MAPPING.get(spacy_type)
 
     def extract_knowledge_from_text(self, text: str) -> List[Tuple[Node, Optional[Edge]]]:
         """Extract knowledge from text and create nodes/edges"""
@@ -167,25 +184,31 @@ class KnowledgeGraph:
         # Extract query entities and relationships
         query_entities = list(query_doc.ents)
 
+        graph = self.graph
         for entity in query_entities:
+            entity_text = entity.text.lower()
+            entity_label = entity.label_
+
             # Find nodes matching entity type or text
             matching_nodes = []
-            for node in self.graph.nodes():
-                node_data = self.graph.nodes[node]
+            for node, node_data in graph.nodes(data=True):
                 node_props = node_data.get("properties", {})
 
                 # Match by text or type
-                if (node_props.get("text", "").lower() == entity.text.lower() or
-                    node_data.get("type") == entity.label_):
+                if (node_props.get("text", "").lower() == entity_text or
+                    node_data.get("type") == entity_label):
                     matching_nodes.append(node)
 
             # Find paths between matching nodes
             for node1 in matching_nodes:
                 paths = {}
-                for node2 in self.graph.nodes():
-                    if node1 != node2:
+                # One DFS finds every reachable node, so unreachable pairs
+                # never pay for a path enumeration
+                reachable = nx.descendants(graph, node1)
+                for node2 in graph.nodes():
+                    if node2 in reachable:
                         try:
-                            all_paths = list(nx.all_simple_paths(self.graph, node1, node2))
+                            all_paths = list(nx.all_simple_paths(graph, node1, node2))
                             if all_paths:
                                 paths[node2] = all_paths
                         except nx.NetworkXNoPath:
@@ -206,8 +229,10 @@ class KnowledgeGraph:
 
         # Pattern-based inference
         for node1 in self.graph.nodes():
+            # Only nodes within two hops can close an A->B->C pattern
+            nearby = nx.single_source_shortest_path_length(self.graph, node1, cutoff=2)
             for node2 in self.graph.nodes():
-                if node1 != node2:
+                if node1 != node2 and node2 in nearby:
                     # Check for transitive relationships
                     paths = list(nx.all_simple_paths(self.graph, node1, node2, cutoff=2))
                     if paths:
@@ -284,12 +309,11 @@ class KnowledgeGraph:
     def query(self, node_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Query nodes by type"""
         results = []
-        for node_id in self.graph.nodes:
-            node_data = dict(self.graph.nodes[node_id])
-            if node_type is None or node_data.get('type') == node_type:
+        for node_id, attrs in self.graph.nodes(data=True):
+            if node_type is None or attrs.get('type') == node_type:
                 results.append({
                     'id': node_id,
-                    'data': node_data
+                    'data': dict(attrs)
                 })
         return results
 
@@ -301,8 +325,9 @@ class KnowledgeGraph:
 
     def load(self, filepath: str):
         """Load knowledge graph from file"""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        data = _json_loads(raw)
         self.graph = nx.node_link_graph(data, edges="edges")  # Explicitly set edges parameter
 
     def cleanup(self):
@@ -3,7 +3,8 @@ Base classes for LLM integration
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
+import asyncio
 from pydantic import BaseModel
 
 class LLMProvider(ABC):
@@ -33,3 +34,27 @@ class LLMProvider(ABC):
     async def embed(self, text: str) -> List[float]:
         """Generate embeddings for the given text"""
         pass
+
+    async def complete_batch(self,
+        prompts: List[str],
+        max_parallel: int = 8,
+        **kwargs
+    ) -> List[Union[str, BaseException]]:
+        """Generate completions for several prompts concurrently.
+
+        At most max_parallel requests are in flight at once. Results are
+        returned in prompt order; a failed prompt yields its exception.
+        """
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def complete_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.complete(prompt, **kwargs)
+
+        return await asyncio.gather(
+            *[complete_one(prompt) for prompt in prompts],
+            return_exceptions=True
+        )
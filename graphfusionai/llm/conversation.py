@@ -2,9 +2,11 @@
 Conversation management system
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Deque
 from pydantic import BaseModel
 from datetime import datetime
+from collections import deque
+from itertools import islice
 
 class Message(BaseModel):
     """Message in a conversation"""
@@ -17,7 +19,8 @@ class ConversationManager:
     """Manages conversation history and context"""
     
     def __init__(self, max_history: int = 100):
-        self.messages: List[Message] = []
+        # Bounded ring buffer: the oldest message is dropped once full
+        self.messages: Deque[Message] = deque(maxlen=max_history)
         self.max_history = max_history
     
     def add_message(self, role: str, content: str, **metadata):
@@ -28,20 +31,16 @@ class ConversationManager:
             metadata=metadata
         )
         self.messages.append(message)
-        
-        # Trim history if needed
-        if len(self.messages) > self.max_history:
-            self.messages = self.messages[-self.max_history:]
     
     def get_history(self, last_n: Optional[int] = None) -> List[Message]:
         """Get conversation history"""
         if last_n:
-            return self.messages[-last_n:]
-        return self.messages
+            return list(islice(self.messages, max(len(self.messages) - last_n, 0), None))
+        return list(self.messages)
     
     def clear(self):
         """Clear conversation history"""
-        self.messages = []
+        self.messages.clear()
     
     def format_for_llm(self) -> List[Dict[str, str]]:
         """Format conversation history for LLM API"""
@@ -5,7 +5,7 @@ LLM Agent implementation using OpenAI's API for enhanced intelligence.
 import json
 from typing import Dict, Any, Optional
 from graphfusionai import Agent, Role, Message
-from openai import OpenAI
+from openai import AsyncOpenAI
 import os
 
 class LLMAgent(Agent):
@@ -22,7 +22,7 @@ class LLMAgent(Agent):
         """
         super().__init__(name=name, role=role)
         self.model = model
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         
     async def _process_task(self, task: Dict[str, Any]) -> Any:
         """Process task using OpenAI's API"""
@@ -84,3 +84,8 @@ class LLMAgent(Agent):
                 "status": "error",
                 "error": str(e)
             }
+
+    async def cleanup(self):
+        """Cleanup agent resources and close the OpenAI client"""
+        await super().cleanup()
+        await self.client.close()
@@ -7,6 +7,21 @@ from datetime import datetime
 from pydantic import BaseModel
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON with orjson when available, falling back to json for
+    documents orjson rejects (NaN/Infinity literals, integers over 64 bits)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 class MemoryEntry(BaseModel):
     """Memory entry with metadata"""
     key: str
@@ -117,8 +132,9 @@ class BaseMemory:
     def load_from_file(self, filepath: str) -> bool:
         """Load memory from file"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            data = _json_loads(raw)
             
             self.entries = {
                 key: MemoryEntry(
@@ -4,19 +4,31 @@ Vectorized memory implementation with semantic search
 
 from typing import Any, Dict, List, Optional, Union, cast
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
+import heapq
 import logging
+from collections import Counter
 from pathlib import Path
 
 from .base import BaseMemory, MemoryEntry, MemoryQueryResult
 
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
 logger = logging.getLogger(__name__)
 
 class VectorMemory(BaseMemory):
     """Memory implementation with vector storage and semantic search"""
 
+    # Below this many entries a plain matmul beats a FAISS lookup
+    FAISS_MIN_ENTRIES = 10000
+    # After a change invalidates the index, this many searches are answered
+    # by matmul before it is rebuilt, so churn never pays a rebuild per search
+    FAISS_REBUILD_AFTER = 4
+
     def __init__(self, dimension: int = 384, cache_dir: Optional[str] = None):
         """Initialize vector memory
 
@@ -32,6 +44,16 @@ class VectorMemory(BaseMemory):
             self.vectors: List[np.ndarray] = []
             self.keys: List[str] = []
 
+            # L2-normalized rows kept contiguous for batched similarity search;
+            # capacity grows by doubling, only the first _size rows are live
+            self._matrix = np.empty((0, dimension), dtype=np.float32)
+            self._size = 0
+            self._rows: Dict[str, int] = {}  # key -> row in _matrix, keys and vectors
+
+            # FAISS inner-product index over the same rows, built lazily by search
+            self._index = None
+            self._stale_searches = 0  # large searches run since the index was dropped
+
             # Setup caching if enabled
             self.cache_dir = Path(cache_dir) if cache_dir else None
             if self.cache_dir:
@@ -47,22 +69,112 @@ class VectorMemory(BaseMemory):
             return None
         return self.cache_dir / f"{key}.npy"
 
+    def _write_row(self, idx: int, vector: np.ndarray, normalized: bool = False) -> None:
+        """Write an L2-normalized copy of vector into row idx of the similarity matrix"""
+        row = self._matrix[idx]
+        row[:] = vector
+        if normalized:
+            return
+        norm = np.linalg.norm(row)
+        if norm > 0:
+            row /= norm
+
+    def _append_row(self, key: str, vector: np.ndarray, normalized: bool = False) -> None:
+        """Add a new row for key"""
+        if self._size == len(self._matrix):
+            grown = np.empty((max(2 * self._size, 16), self.dimension), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+
+        self._write_row(self._size, vector, normalized)
+        self._rows[key] = self._size
+        self.keys.append(key)
+        self.vectors.append(vector)
+        self._size += 1
+
+        if self._index is not None:
+            self._index.add(self._matrix[self._size - 1:self._size])
+
+    def _replace_row(self, key: str, vector: np.ndarray, normalized: bool = False) -> None:
+        """Overwrite the existing row for key in place"""
+        idx = self._rows[key]
+        self.vectors[idx] = vector
+        self._write_row(idx, vector, normalized)
+        self._drop_index()
+
+    def _remove_row(self, key: str) -> None:
+        """Remove the row for key by moving the last row into its slot"""
+        idx = self._rows.pop(key)
+        last = self._size - 1
+        if idx != last:
+            moved = self.keys[last]
+            self.keys[idx] = moved
+            self.vectors[idx] = self.vectors[last]
+            self._matrix[idx] = self._matrix[last]
+            self._rows[moved] = idx
+
+        self.keys.pop()
+        self.vectors.pop()
+        self._size -= 1
+
+        # Flat indexes renumber on removal; rebuild lazily once searches settle
+        self._drop_index()
+
+    def _drop_index(self) -> None:
+        """Invalidate the FAISS index after rows were overwritten or moved"""
+        self._index = None
+        self._stale_searches = 0
+
+    def _use_index(self, limit: int) -> bool:
+        """Whether to answer a search from the FAISS index, building it if due"""
+        if faiss is None or limit <= 0 or self._size < self.FAISS_MIN_ENTRIES:
+            return False
+        if self._index is None:
+            self._stale_searches += 1
+            return self._stale_searches > self.FAISS_REBUILD_AFTER
+        return True
+
+    def _matmul_search(self, query_vector: np.ndarray, limit: int):
+        """Score every row with one matrix-vector product and return the top hits"""
+        similarities = self._matrix[:self._size] @ query_vector
+
+        # Partition out the best candidates before sorting
+        n = len(similarities)
+        if 0 < limit < n:
+            candidates = np.argpartition(similarities, n - limit)[n - limit:]
+        else:
+            candidates = np.arange(n)
+        indices = candidates[np.argsort(similarities[candidates])[::-1]][:limit]
+        return indices, similarities[indices]
+
+    def _index_search(self, query_vector: np.ndarray, limit: int):
+        """Return the top hits from the FAISS index, building it if needed"""
+        if self._index is None:
+            self._index = faiss.IndexFlatIP(self.dimension)
+            self._index.add(self._matrix[:self._size])
+
+        scores, indices = self._index.search(
+            np.ascontiguousarray(query_vector[None, :]), min(limit, self._size)
+        )
+        return indices[0], scores[0]
+
     def _text_to_simple_vector(self, text: str) -> np.ndarray:
         """Convert text to a simple vector representation
         This is a basic implementation - for production use a proper embedding model
         """
         try:
             # Create a simple vector based on character frequencies
-            freq = np.zeros(self.dimension, dtype=np.float32)
-
-            # Handle long texts by chunking
-            chunk_size = 1000  # Process text in chunks
+            chunk_size = 1000  # Bucket by position within each 1000-char chunk
             text = text.lower()
 
-            for i in range(0, len(text), chunk_size):
-                chunk = text[i:i + chunk_size]
-                for j, char in enumerate(chunk):
-                    freq[j % self.dimension] += ord(char)
+            # Code points straight from the UTF-32 buffer, summed per bucket in one pass
+            codes = np.frombuffer(
+                text.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32
+            )
+            buckets = np.arange(len(codes)) % chunk_size % self.dimension
+            freq = np.bincount(
+                buckets, weights=codes, minlength=self.dimension
+            ).astype(np.float32)
 
             # Normalize
             norm = np.linalg.norm(freq)
@@ -85,6 +197,8 @@ class VectorMemory(BaseMemory):
     ) -> None:
         """Store value with vector embedding"""
         try:
+            # Generated vectors come out unit length and skip renormalization
+            normalized = vector is None
             if vector is None and text is not None:
                 # Generate vector from text if provided
                 vector = self._text_to_simple_vector(text)
@@ -119,8 +233,10 @@ class VectorMemory(BaseMemory):
 
             # Store entry and update vectors
             self.entries[key] = entry
-            self.vectors.append(vector)
-            self.keys.append(key)
+            if key in self._rows:
+                self._replace_row(key, vector, normalized)
+            else:
+                self._append_row(key, vector, normalized)
 
         except Exception as e:
             logger.error(f"Failed to store key {key}: {str(e)}")
@@ -161,11 +277,15 @@ class VectorMemory(BaseMemory):
             memory_type: Filter by memory type
         """
         try:
-            if not self.vectors:
+            if not self._size:
                 return []
 
             # Convert query to vector if it's text
-            query_vector = query if isinstance(query, np.ndarray) else self._text_to_simple_vector(query)
+            is_text = not isinstance(query, np.ndarray)
+            if is_text:
+                query_vector = self._text_to_simple_vector(query)
+            else:
+                query_vector = np.asarray(query, dtype=np.float32)
 
             # Ensure query vector is the right dimension
             if len(query_vector) != self.dimension:
@@ -173,16 +293,20 @@ class VectorMemory(BaseMemory):
                     f"Query vector dimension mismatch. Expected {self.dimension}, got {len(query_vector)}"
                 )
 
-            # Calculate similarities
-            vectors = np.array(self.vectors, dtype=np.float32)
-            similarities = cosine_similarity([query_vector], vectors)[0]
+            # Rows are stored normalized, so cosine similarity is an inner product;
+            # text vectors are already unit length
+            if not is_text:
+                query_norm = np.linalg.norm(query_vector)
+                if query_norm > 0:
+                    query_vector = query_vector / query_norm
 
-            # Get top results
-            indices = np.argsort(similarities)[::-1][:limit]
+            if self._use_index(limit):
+                indices, scores = self._index_search(query_vector, limit)
+            else:
+                indices, scores = self._matmul_search(query_vector, limit)
 
             results = []
-            for idx in indices:
-                score = similarities[idx]
+            for idx, score in zip(indices, scores):
                 if score < threshold:
                     continue
 
@@ -196,7 +320,7 @@ class VectorMemory(BaseMemory):
                 results.append(MemoryQueryResult(
                     key=key,
                     value=entry.value,
-                    score=float(score),
+                    similarity=float(score),
                     metadata=entry.metadata
                 ))
 
@@ -210,10 +334,8 @@ class VectorMemory(BaseMemory):
         """Remove entry from memory"""
         try:
             if key in self.entries:
-                idx = self.keys.index(key)
                 self.entries.pop(key)
-                self.vectors.pop(idx)
-                self.keys.pop(idx)
+                self._remove_row(key)
 
                 # Remove cached embedding
                 cache_path = self._get_cache_path(key)
@@ -231,13 +353,12 @@ class VectorMemory(BaseMemory):
             max_age: Maximum age in seconds for short-term memories
         """
         try:
-            keys_to_remove = []
-
-            for key, entry in self.entries.items():
-                if entry.memory_type == "short_term":
-                    age = (datetime.now() - entry.timestamp).total_seconds()
-                    if age > max_age:
-                        keys_to_remove.append(key)
+            # One clock read for the whole pass; older than cutoff means age > max_age
+            cutoff = datetime.now() - timedelta(seconds=max_age)
+            keys_to_remove = [
+                key for key, entry in self.entries.items()
+                if entry.memory_type == "short_term" and entry.timestamp < cutoff
+            ]
 
             for key in keys_to_remove:
                 self.forget(key)
@@ -257,11 +378,13 @@ class VectorMemory(BaseMemory):
             else:
                 entries = list(self.entries.values())
 
+            type_counts = Counter(e.memory_type for e in entries)
+
             summary = {
                 "total_entries": len(entries),
                 "memory_types": {
-                    "short_term": len([e for e in entries if e.memory_type == "short_term"]),
-                    "long_term": len([e for e in entries if e.memory_type == "long_term"])
+                    "short_term": type_counts["short_term"],
+                    "long_term": type_counts["long_term"]
                 },
                 "latest_entries": [
                     {
@@ -270,7 +393,7 @@ class VectorMemory(BaseMemory):
                         "memory_type": e.memory_type,
                         "metadata": e.metadata
                     }
-                    for e in sorted(entries, key=lambda x: x.timestamp, reverse=True)[:5]
+                    for e in heapq.nlargest(5, entries, key=lambda x: x.timestamp)
                 ]
             }
 
@@ -1,6 +1,13 @@
 from typing import Dict, List, Any, Optional
 from pydantic import BaseModel
 
+# Python types accepted for each ontology property data type
+_PROPERTY_TYPES = {
+    "string": str,
+    "number": (int, float),
+    "boolean": bool,
+}
+
 class OntologyClass(BaseModel):
     """Defines a class in the ontology"""
     name: str
@@ -57,12 +64,9 @@ class Ontology:
             if prop_name not in instance:
                 return False
             
-            # Basic type checking
-            if prop_type == "string" and not isinstance(instance[prop_name], str):
-                return False
-            elif prop_type == "number" and not isinstance(instance[prop_name], (int, float)):
-                return False
-            elif prop_type == "boolean" and not isinstance(instance[prop_name], bool):
+            # Basic type checking; unknown data types are not checked
+            expected_type = _PROPERTY_TYPES.get(prop_type)
+            if expected_type is not None and not isinstance(instance[prop_name], expected_type):
                 return False
 
         return True
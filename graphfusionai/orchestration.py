@@ -6,6 +6,7 @@ from typing import Dict, List, Any, Optional, Type, Union
 from pydantic import BaseModel
 import asyncio
 from uuid import uuid4
+import operator
 
 from .agent import Agent, Role
 from .task_orchestrator import Task
@@ -16,6 +17,14 @@ class AgentTemplate(BaseModel):
     agent_class: Type[Agent]
     init_params: Dict[str, Any] = {}
 
+# Comparison for each condition operator, called as compare(field_value, value)
+_CONDITION_OPERATORS = {
+    "eq": operator.eq,
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "contains": operator.contains,
+}
+
 class WorkflowCondition(BaseModel):
     """Defines conditions for workflow execution"""
     field: str  # The field to check in the task result
@@ -30,15 +39,10 @@ class WorkflowCondition(BaseModel):
             for key in self.field.split('.'):
                 field_value = field_value[key]
 
-            if self.operator == "eq":
-                return field_value == self.value
-            elif self.operator == "gt":
-                return field_value > self.value
-            elif self.operator == "lt":
-                return field_value < self.value
-            elif self.operator == "contains":
-                return self.value in field_value
-            return False
+            compare = _CONDITION_OPERATORS.get(self.operator)
+            if compare is None:
+                return False
+            return compare(field_value, self.value)
         except (KeyError, TypeError):
             return False
 
@@ -62,10 +66,10 @@ class AgentOrchestrator:
 
     def create_agent(self, template_name: str, agent_name: Optional[str] = None) -> Agent:
         """Create a new agent from template"""
-        if template_name not in self.agent_templates:
+        template = self.agent_templates.get(template_name)
+        if template is None:
             raise ValueError(f"Template {template_name} not found")
 
-        template = self.agent_templates[template_name]
         agent_name = agent_name or f"{template_name}_{str(uuid4())[:8]}"
 
         # Create agent instance
@@ -83,10 +87,8 @@ class AgentOrchestrator:
         async def execute_single(task: Dict[str, Any]) -> Dict[str, Any]:
             try:
                 # Get or create agent based on task requirements
-                agent = None
-                if "agent_id" in task and task["agent_id"] in self.active_agents:
-                    agent = self.active_agents[task["agent_id"]]
-                elif "agent_type" in task and task["agent_type"] in self.agent_templates:
+                agent = self.active_agents.get(task.get("agent_id"))
+                if agent is None and task.get("agent_type") in self.agent_templates:
                     agent = self.create_agent(task["agent_type"])
 
                 if not agent:
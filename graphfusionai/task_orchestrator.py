@@ -1,10 +1,28 @@
-from typing import Dict, List, Any, Optional
-from collections import deque
+from typing import Dict, List, Any, Optional, Tuple
 from pydantic import BaseModel
 import asyncio
+import copy
+import hashlib
+import heapq
+import itertools
+import json
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 
+def _is_plain_json(value: Any) -> bool:
+    """Whether value encodes to JSON losslessly: str keys, lists and scalars only"""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_plain_json(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(k, str) and _is_plain_json(v) for k, v in value.items()
+        )
+    return False
+
 class Task(BaseModel):
     """Task definition"""
     id: str
@@ -15,16 +33,27 @@ class Task(BaseModel):
     status: str = "pending"
     created_at: datetime = datetime.now()
     timeout: Optional[float] = None  # Timeout in seconds
+    memoize: bool = False  # Reuse the result of an identical earlier run
 
 class TaskOrchestrator:
     """Manages task distribution and execution"""
 
+    # Bounds for memoized results: least recently used entries are evicted
+    # past MEMO_MAX_ENTRIES, and entries older than MEMO_TTL seconds expire
+    MEMO_MAX_ENTRIES = 1024
+    MEMO_TTL: Optional[float] = None
+
     def __init__(self):
-        self.task_queue = deque()
+        # Heap of (-priority, insertion order, task): highest priority first, FIFO among equals
+        self.task_queue: List[Tuple[int, int, Task]] = []
+        self._queue_counter = itertools.count()
         self.active_tasks: Dict[str, Task] = {}
         self.completed_tasks: Dict[str, Dict[str, Any]] = {}
         self.logger = logging.getLogger("TaskOrchestrator")
         self._task_timeouts: Dict[str, asyncio.Task] = {}
+        # Successful results of memoized tasks, keyed by a digest of agent + task input,
+        # stored as (result, monotonic store time) in LRU order
+        self._result_cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
 
     def add_task(self, task: Dict[str, Any]):
         """Add task to queue"""
@@ -32,24 +61,16 @@ class TaskOrchestrator:
         if isinstance(task, dict):
             task = Task(**task)
         
-        # Sort tasks by priority (higher priority first)
-        if len(self.task_queue) > 0:
-            # Find position to insert based on priority
-            for i, existing_task in enumerate(self.task_queue):
-                if task.priority > existing_task.priority:
-                    self.task_queue.insert(i, task)
-                    break
-            else:
-                self.task_queue.append(task)
-        else:
-            self.task_queue.append(task)
+        heapq.heappush(
+            self.task_queue, (-task.priority, next(self._queue_counter), task)
+        )
             
         self.logger.info(f"Task {task.id} added to queue with priority {task.priority}")
 
     def get_next_task(self) -> Optional[Task]:
         """Get next task from queue"""
         if self.task_queue:
-            task = self.task_queue.popleft()
+            _, _, task = heapq.heappop(self.task_queue)
             self.active_tasks[task.id] = task
             return task
         return None
@@ -61,6 +82,20 @@ class TaskOrchestrator:
             if isinstance(task, dict):
                 task = Task(**task)
 
+            memo_key = self._memo_key(agent, task) if task.memoize else None
+            if task.memoize and memo_key is None:
+                self.logger.debug(
+                    f"Task {task.id} data is not plain JSON; running without memoization"
+                )
+            if memo_key is not None:
+                cached = self._get_memoized(memo_key)
+                if cached is not None:
+                    self.logger.info(f"Reusing memoized result for task {task.id}")
+                    result = {**cached, "task_id": task.id} if "task_id" in cached else cached
+                    self.completed_tasks[task.id] = result
+                    self.active_tasks.pop(task.id, None)
+                    return result
+
             self.logger.info(f"Executing task {task.id} with agent {agent.name}")
 
             # Set up timeout if specified
@@ -82,8 +117,9 @@ class TaskOrchestrator:
 
             # Store result
             self.completed_tasks[task.id] = result
-            if task.id in self.active_tasks:
-                del self.active_tasks[task.id]
+            self.active_tasks.pop(task.id, None)
+            if memo_key is not None and result.get("status") == "success":
+                self._store_memoized(memo_key, result)
 
             return result
 
@@ -95,23 +131,67 @@ class TaskOrchestrator:
                 "task_id": task.id
             }
 
+    @staticmethod
+    def _memo_key(agent, task: Task) -> Optional[str]:
+        """Digest of everything that determines a task's result
+
+        Returns None when the task data has no lossless JSON encoding (numpy
+        arrays, arbitrary objects, non-string keys, tuples), since distinct
+        inputs could then share a key.
+        """
+        try:
+            if not _is_plain_json(task.data):
+                return None
+            payload = json.dumps(
+                {"agent": agent.name, "type": task.type, "data": task.data},
+                sort_keys=True
+            )
+        except (TypeError, ValueError, RecursionError):
+            return None
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _get_memoized(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a live memoized result, dropping it if expired"""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+
+        result, stored_at = entry
+        if self.MEMO_TTL is not None and time.monotonic() - stored_at > self.MEMO_TTL:
+            del self._result_cache[key]
+            return None
+
+        self._result_cache.move_to_end(key)
+        # Hand out a copy so callers cannot mutate the memoized result
+        return copy.deepcopy(result)
+
+    def _store_memoized(self, key: str, result: Dict[str, Any]):
+        """Store a result, evicting the least recently used entry when full"""
+        self._result_cache[key] = (copy.deepcopy(result), time.monotonic())
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.MEMO_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
+    def clear_memo(self):
+        """Drop all memoized task results"""
+        self._result_cache.clear()
+
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel a running task"""
-        if task_id in self._task_timeouts:
-            self._task_timeouts[task_id].cancel()
-            try:
-                await self._task_timeouts[task_id]
-            except asyncio.CancelledError:
-                pass
-            del self._task_timeouts[task_id]
-            
-            if task_id in self.active_tasks:
-                del self.active_tasks[task_id]
-                
-            self.logger.info(f"Task {task_id} cancelled")
-            return True
-            
-        return False
+        timeout_task = self._task_timeouts.pop(task_id, None)
+        if timeout_task is None:
+            return False
+
+        timeout_task.cancel()
+        try:
+            await timeout_task
+        except asyncio.CancelledError:
+            pass
+
+        self.active_tasks.pop(task_id, None)
+
+        self.logger.info(f"Task {task_id} cancelled")
+        return True
 
     async def cleanup(self):
         """Cleanup all running tasks"""
@@ -120,6 +200,7 @@ class TaskOrchestrator:
         
         self.task_queue.clear()
         self.active_tasks.clear()
+        self._result_cache.clear()
         self.logger.info("Task orchestrator cleaned up")
 
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
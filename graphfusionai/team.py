@@ -1,6 +1,7 @@
 """Team management system for agent collaboration"""
 
 from typing import Dict, Any, Optional, List
+import asyncio
 from .agent import Agent, Role
 from .knowledge_graph import KnowledgeGraph
 from .memory import Memory
@@ -11,8 +12,31 @@ class Team:
         self.name = name
         self.leader = leader
         self.members: Dict[str, Agent] = {}
-        self.shared_memory = Memory()
-        self.knowledge_graph = KnowledgeGraph()
+        # Built on first access; the knowledge graph loads a spaCy model
+        self._shared_memory: Optional[Memory] = None
+        self._knowledge_graph: Optional[KnowledgeGraph] = None
+
+    @property
+    def shared_memory(self) -> Memory:
+        """Memory shared by team members, created on first use"""
+        if self._shared_memory is None:
+            self._shared_memory = Memory()
+        return self._shared_memory
+
+    @shared_memory.setter
+    def shared_memory(self, memory: Memory):
+        self._shared_memory = memory
+
+    @property
+    def knowledge_graph(self) -> KnowledgeGraph:
+        """Team knowledge graph, created on first use"""
+        if self._knowledge_graph is None:
+            self._knowledge_graph = KnowledgeGraph()
+        return self._knowledge_graph
+
+    @knowledge_graph.setter
+    def knowledge_graph(self, graph: KnowledgeGraph):
+        self._knowledge_graph = graph
         
     def add_member(self, role: str, agent: Agent):
         """Add a team member with specific role"""
@@ -37,15 +61,19 @@ class Team:
         ]
         
     async def broadcast(self, message: Dict[str, Any]):
-        """Broadcast message to all team members"""
-        results = {}
-        for role, agent in self.members.items():
+        """Broadcast message to all team members concurrently"""
+        async def deliver(agent: Agent) -> Dict[str, Any]:
             try:
-                result = await agent.handle_task(message)
-                results[role] = result
+                return await agent.handle_task(message)
             except Exception as e:
-                results[role] = {"status": "error", "error": str(e)}
-        return results
+                return {"status": "error", "error": str(e)}
+
+        # Snapshot members so roles and replies stay aligned
+        members = list(self.members.items())
+        replies = await asyncio.gather(
+            *[deliver(agent) for _, agent in members]
+        )
+        return {role: reply for (role, _), reply in zip(members, replies)}
         
     def share_knowledge(self, knowledge: Dict[str, Any]):
         """Share knowledge across team members"""
@@ -60,15 +88,23 @@ class Team:
 
     async def cleanup(self):
         """Cleanup team resources"""
-        # Cleanup shared memory
-        self.shared_memory.clear()
-        
-        # Cleanup knowledge graph
-        self.knowledge_graph.cleanup()
+        # Cleanup shared memory and knowledge graph, if they were ever built
+        if self._shared_memory is not None:
+            self._shared_memory.clear()
+        if self._knowledge_graph is not None:
+            self._knowledge_graph.cleanup()
         
-        # Cleanup all member agents
-        for agent in self.members.values():
-            await agent.cleanup()
+        # Cleanup all member agents concurrently, waiting for every teardown
+        # even if some of them fail
+        results = await asyncio.gather(
+            *[agent.cleanup() for agent in self.members.values()],
+            return_exceptions=True
+        )
             
         # Clear members
         self.members.clear()
+
+        # Surface the first teardown failure once everything has finished
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
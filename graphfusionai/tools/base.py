@@ -4,6 +4,7 @@ Base classes for tool framework
 
 from typing import Any, Callable, Dict, List, Optional, Union
 from pydantic import BaseModel
+from functools import lru_cache
 import inspect
 from datetime import datetime
 import json
@@ -11,6 +12,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def resolve_type_spec(type_spec: str) -> Any:
+    """Resolve a schema type string such as "int" to its type.
+
+    Resolved specs are cached, so validating a tool call does not
+    re-evaluate the schema on every invocation. Invalid specs raise
+    NameError/SyntaxError and are not cached.
+    """
+    return eval(type_spec)
+
 class ToolMetadata(BaseModel):
     """Metadata for tool registration and discovery"""
     name: str
@@ -72,7 +83,7 @@ class Tool(BaseModel):
                     return False
 
                 try:
-                    expected_type = eval(param_type)
+                    expected_type = resolve_type_spec(param_type)
                     if not isinstance(kwargs[param], expected_type):
                         logger.error(
                             f"Invalid type for {param}: got {type(kwargs[param]).__name__}, "
@@ -102,7 +113,7 @@ class Tool(BaseModel):
                 return False
 
             try:
-                expected_type = eval(type_spec)
+                expected_type = resolve_type_spec(type_spec)
                 if not isinstance(result, expected_type):
                     logger.error(
                         f"Invalid output type: got {type(result).__name__}, "
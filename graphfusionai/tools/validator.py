@@ -3,13 +3,21 @@ Tool validation and safety checks
 """
 
 from typing import List, Optional, Dict, Any
-from .base import Tool, ToolMetadata
+from .base import Tool, ToolMetadata, resolve_type_spec
 import logging
 import inspect
 from pydantic import BaseModel, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Permissions a tool may declare in its metadata
+VALID_PERMISSIONS = frozenset({
+    "filesystem.read",
+    "filesystem.write",
+    "network.connect",
+    "process.execute"
+})
+
 class ValidationResult(BaseModel):
     """Results of tool validation"""
     valid: bool
@@ -74,13 +82,7 @@ class ToolValidator:
     @staticmethod
     def _validate_permission(permission: str) -> bool:
         """Validate if a permission is recognized"""
-        valid_permissions = {
-            "filesystem.read",
-            "filesystem.write",
-            "network.connect",
-            "process.execute"
-        }
-        return permission in valid_permissions
+        return permission in VALID_PERMISSIONS
     
     @staticmethod
     def _check_requirements(requirements: List[str]) -> List[str]:
@@ -105,7 +107,7 @@ class ToolValidator:
             for param, param_type in tool.metadata.input_schema.items():
                 if param not in kwargs:
                     errors.append(f"Missing required parameter: {param}")
-                elif not isinstance(kwargs[param], eval(param_type)):
+                elif not isinstance(kwargs[param], resolve_type_spec(param_type)):
                     errors.append(
                         f"Invalid type for {param}: expected {param_type}"
                     )
@@ -129,7 +131,7 @@ class ToolValidator:
             
         try:
             # Validate output type
-            expected_type = eval(tool.metadata.output_schema["type"])
+            expected_type = resolve_type_spec(tool.metadata.output_schema["type"])
             if not isinstance(result, expected_type):
                 return ValidationResult(
                     valid=False,
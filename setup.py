@@ -25,9 +25,9 @@ setup(
     ],
     extras_require={
         'dev': [
-            'pytest>=7.0.0',
+            'pytest>=8.2.0',
             'pytest-cov>=4.0.0',
-            'pytest-asyncio>=0.21.0',
+            'pytest-asyncio>=0.26.0',  # session loop scope options in pyproject.toml
             'black>=23.0.0',
             'isort>=5.12.0',
             'mypy>=1.0.0',
@@ -33,7 +33,6 @@ def test_agent_tool_registration(test_agent):
     assert test_agent._tools["test_tool"].name == "test_tool"
     assert test_agent._tools["test_tool"].description == "A test tool"
 
-@pytest.mark.asyncio
 async def test_agent_task_handling(test_agent):
     """Test task handling"""
     with pytest.raises(ValueError):
@@ -56,7 +55,6 @@ def test_agent_memory(test_agent):
     assert test_agent.recall("test_key") == "test_value"
     assert test_agent.recall("non_existent") is None
 
-@pytest.mark.asyncio
 async def test_agent_tool_execution(test_agent):
     """Test tool execution"""
     @test_agent.tool()
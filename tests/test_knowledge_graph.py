@@ -0,0 +1,41 @@
+"""Tests for KnowledgeGraph functionality"""
+
+import math
+import pytest
+import graphfusionai.knowledge_graph as knowledge_graph
+from graphfusionai.knowledge_graph import KnowledgeGraph, Node, Edge
+
+# KnowledgeGraph loads this spaCy model on construction
+pytest.importorskip("en_core_web_sm")
+
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(request, monkeypatch):
+    """Load graph files with the stdlib json module or with orjson"""
+    if request.param == "json":
+        monkeypatch.setattr(knowledge_graph, "orjson", None)
+    else:
+        pytest.importorskip("orjson")
+    return request.param
+
+def test_graph_file_round_trip(json_backend, tmp_path):
+    """Test saving and loading keeps nodes, edges and their properties"""
+    graph = KnowledgeGraph()
+    graph.add_node(Node(id="ann", type="person", properties={"score": float("nan"), "big": 2 ** 70}))
+    graph.add_node(Node(id="acme", type="organization", properties={"tags": ["a", "b"]}))
+    graph.add_edge(Edge(source="ann", target="acme", type="belongs_to", properties={"since": 2020}))
+
+    path = tmp_path / "graph.json"
+    graph.save(str(path))
+
+    loaded = KnowledgeGraph()
+    loaded.load(str(path))
+
+    ann = loaded.graph.nodes["ann"]
+    assert ann["type"] == "person"
+    assert math.isnan(ann["properties"]["score"])
+    assert ann["properties"]["big"] == 2 ** 70
+    assert loaded.graph.nodes["acme"]["properties"] == {"tags": ["a", "b"]}
+    assert [
+        (u, v, data["type"], data["properties"])
+        for u, v, data in loaded.graph.edges(data=True)
+    ] == [("ann", "acme", "belongs_to", {"since": 2020})]
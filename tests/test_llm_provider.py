@@ -0,0 +1,59 @@
+"""Tests for LLMProvider functionality"""
+
+import asyncio
+import pytest
+from graphfusionai.llm import LLMProvider
+
+class EchoProvider(LLMProvider):
+    """Provider that echoes prompts and tracks concurrent requests"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def complete(self, prompt, max_tokens=None, temperature=0.7, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            # Later prompts finish first, so ordering comes from gather
+            await asyncio.sleep(0.01 / (1 + len(prompt)))
+            if prompt == "fail":
+                raise RuntimeError(prompt)
+            return f"{prompt}:{temperature}"
+        finally:
+            self.in_flight -= 1
+
+    async def chat(self, messages, max_tokens=None, temperature=0.7, **kwargs):
+        raise NotImplementedError
+
+    async def embed(self, text):
+        raise NotImplementedError
+
+@pytest.fixture
+def provider():
+    return EchoProvider()
+
+async def test_complete_batch_keeps_prompt_order(provider):
+    """Test results line up with their prompts and kwargs are forwarded"""
+    prompts = ["a", "bb", "ccc", "dddd"]
+    results = await provider.complete_batch(prompts, temperature=0.1)
+
+    assert results == ["a:0.1", "bb:0.1", "ccc:0.1", "dddd:0.1"]
+
+async def test_complete_batch_bounds_concurrency(provider):
+    """Test no more than max_parallel completions run at once"""
+    await provider.complete_batch([str(i) for i in range(10)], max_parallel=3)
+
+    assert provider.peak == 3
+
+async def test_complete_batch_returns_exceptions_in_place(provider):
+    """Test a failed prompt yields its exception without failing the batch"""
+    results = await provider.complete_batch(["a", "fail", "c"])
+
+    assert results[0] == "a:0.7" and results[2] == "c:0.7"
+    assert isinstance(results[1], RuntimeError)
+
+async def test_complete_batch_rejects_non_positive_parallelism(provider):
+    """Test max_parallel below one is rejected instead of hanging"""
+    with pytest.raises(ValueError):
+        await provider.complete_batch(["a"], max_parallel=0)
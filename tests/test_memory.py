@@ -1,7 +1,10 @@
 """Tests for Memory functionality"""
 
+import math
 import pytest
 import numpy as np
+from datetime import datetime
+import graphfusionai.memory.base as memory_base
 from graphfusionai.memory import Memory
 from graphfusionai.memory.vectorstore import VectorMemory
 
@@ -111,3 +114,113 @@ def test_memory_forget(vector_memory):
     assert "forget_me" not in vector_memory.entries
     assert len(vector_memory.vectors) == 0
     assert len(vector_memory.keys) == 0
+
+@pytest.fixture(params=["numpy", "faiss"])
+def search_memory(request, vector_memory, monkeypatch):
+    """Vector memory searched with NumPy, or through FAISS when available"""
+    if request.param == "faiss":
+        pytest.importorskip("faiss")
+        monkeypatch.setattr(vector_memory, "FAISS_MIN_ENTRIES", 1)
+        monkeypatch.setattr(vector_memory, "FAISS_REBUILD_AFTER", 0)
+    return vector_memory
+
+def unit_vector(i, dimension=5):
+    vector = np.zeros(dimension, dtype=np.float32)
+    vector[i] = 1.0
+    return vector
+
+def test_memory_store_existing_key_overwrites(search_memory):
+    """Test storing an existing key replaces its value and vector"""
+    search_memory.store(key="a", value="old", vector=unit_vector(0))
+    search_memory.store(key="b", value="other", vector=unit_vector(1))
+    search_memory.search(query=unit_vector(0), limit=1)  # build any index
+    search_memory.store(key="a", value="new", vector=unit_vector(2))
+
+    assert search_memory.retrieve("a") == "new"
+    assert len(search_memory.keys) == 2
+    assert len(search_memory.vectors) == 2
+
+    results = search_memory.search(query=unit_vector(2), limit=1)
+    assert [(r.key, r.value) for r in results] == [("a", "new")]
+    assert search_memory.search(query=unit_vector(0), limit=2) == []
+
+def test_memory_forget_middle_key_then_search(search_memory):
+    """Test forgetting a middle entry keeps the remaining entries searchable"""
+    for i, key in enumerate(["a", "b", "c", "d"]):
+        search_memory.store(key=key, value=f"{key} content", vector=unit_vector(i))
+    search_memory.search(query=unit_vector(0), limit=1)  # build any index
+
+    search_memory.forget("b")
+
+    assert sorted(search_memory.keys) == ["a", "c", "d"]
+    assert len(search_memory.vectors) == 3
+    assert search_memory.search(query=unit_vector(1), limit=4) == []
+    for i, key in [(0, "a"), (2, "c"), (3, "d")]:
+        results = search_memory.search(query=unit_vector(i), limit=1)
+        assert [(r.key, r.value) for r in results] == [(key, f"{key} content")]
+
+    # Rows stored after a removal are searchable too
+    search_memory.store(key="e", value="e content", vector=unit_vector(4))
+    results = search_memory.search(query=unit_vector(4), limit=1)
+    assert [r.key for r in results] == ["e"]
+
+def test_memory_faiss_index_rebuilt_after_changes_settle(vector_memory, monkeypatch):
+    """Test searches after a change use matmul until the index is due a rebuild"""
+    pytest.importorskip("faiss")
+    monkeypatch.setattr(vector_memory, "FAISS_MIN_ENTRIES", 1)
+    monkeypatch.setattr(vector_memory, "FAISS_REBUILD_AFTER", 2)
+    for i, key in enumerate(["a", "b", "c"]):
+        vector_memory.store(key=key, value=key, vector=unit_vector(i))
+
+    def search_key(i):
+        return [r.key for r in vector_memory.search(query=unit_vector(i), limit=1)]
+
+    assert search_key(0) == ["a"] and search_key(1) == ["b"]
+    assert vector_memory._index is None
+    assert search_key(2) == ["c"]
+    assert vector_memory._index is not None
+
+    vector_memory.forget("a")
+    assert vector_memory._index is None
+    assert search_key(2) == ["c"] and search_key(1) == ["b"]
+    assert vector_memory._index is None
+    assert search_key(0) == []
+    assert vector_memory._index is not None
+
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(request, monkeypatch):
+    """Load memory files with the stdlib json module or with orjson"""
+    if request.param == "json":
+        monkeypatch.setattr(memory_base, "orjson", None)
+    else:
+        pytest.importorskip("orjson")
+    return request.param
+
+def test_memory_file_round_trip(vector_memory, json_backend, tmp_path):
+    """Test saving and loading keeps values orjson alone would lose or reject"""
+    value = {
+        "nan": float("nan"),
+        "big": 2 ** 70,
+        "nested": {"items": [1, 2.5, None, True], "text": "caf\u00e9"}
+    }
+    vector_memory.store(key="k", value=value, text="round trip", metadata={"n": 1})
+
+    path = tmp_path / "memory.json"
+    assert vector_memory.save_to_file(str(path))
+
+    loaded = VectorMemory(dimension=5)
+    assert loaded.load_from_file(str(path))
+
+    result = loaded.entries["k"]
+    assert math.isnan(result.value["nan"])
+    assert result.value["big"] == 2 ** 70
+    assert result.value["nested"] == value["nested"]
+    assert result.metadata == {"n": 1}
+    assert result.vector == vector_memory.entries["k"].vector
+
+@pytest.mark.parametrize("value", [np.arange(3), datetime(2024, 1, 1)])
+def test_memory_file_rejects_non_json_values(vector_memory, json_backend, tmp_path, value):
+    """Test values outside plain JSON fail to save with either backend"""
+    vector_memory.store(key="k", value=value, text="not json")
+
+    assert not vector_memory.save_to_file(str(tmp_path / "memory.json"))
@@ -0,0 +1,132 @@
+"""Tests for TaskOrchestrator functionality"""
+
+import pytest
+import numpy as np
+from graphfusionai.task_orchestrator import TaskOrchestrator
+
+class CountingAgent:
+    """Minimal agent that records how often it handles a task"""
+
+    def __init__(self, name="Worker", status="success"):
+        self.name = name
+        self.status = status
+        self.calls = 0
+
+    async def handle_task(self, task):
+        self.calls += 1
+        return {
+            "status": self.status,
+            "result": {"value": [task["data"]["x"]]},
+            "task_id": task["id"]
+        }
+
+@pytest.fixture
+def orchestrator():
+    return TaskOrchestrator()
+
+@pytest.fixture
+def agent():
+    return CountingAgent()
+
+def make_task(task_id, x=1, memoize=True):
+    return {"id": task_id, "type": "compute", "data": {"x": x}, "memoize": memoize}
+
+async def test_memoized_task_reuses_result(orchestrator, agent):
+    """Test identical memoized tasks run once"""
+    first = await orchestrator.execute_task(agent, make_task("t1"))
+    second = await orchestrator.execute_task(agent, make_task("t2"))
+
+    assert agent.calls == 1
+    assert second["result"] == first["result"]
+    assert second["task_id"] == "t2"
+    assert orchestrator.completed_tasks["t2"]["task_id"] == "t2"
+
+async def test_unmemoized_task_always_runs(orchestrator, agent):
+    """Test tasks without memoize are executed every time"""
+    await orchestrator.execute_task(agent, make_task("t1", memoize=False))
+    await orchestrator.execute_task(agent, make_task("t2", memoize=False))
+
+    assert agent.calls == 2
+
+async def test_memoized_result_is_isolated_from_callers(orchestrator, agent):
+    """Test mutating a returned result does not change the memo"""
+    first = await orchestrator.execute_task(agent, make_task("t1"))
+    first["result"]["value"].append(99)
+
+    second = await orchestrator.execute_task(agent, make_task("t2"))
+    assert second["result"] == {"value": [1]}
+    second["result"]["value"].append(99)
+
+    third = await orchestrator.execute_task(agent, make_task("t3"))
+    assert third["result"] == {"value": [1]}
+    assert agent.calls == 1
+
+async def test_non_json_data_is_not_memoized(orchestrator):
+    """Test tasks whose data has no lossless JSON form always run"""
+    class SummingAgent(CountingAgent):
+        async def handle_task(self, task):
+            self.calls += 1
+            return {"status": "success", "result": float(np.sum(task["data"]["x"]))}
+
+    agent = SummingAgent()
+    big = np.zeros(2000)
+    changed = big.copy()
+    changed[1000] = 5
+
+    first = await orchestrator.execute_task(agent, make_task("t1", x=big))
+    second = await orchestrator.execute_task(agent, make_task("t2", x=changed))
+
+    assert (first["result"], second["result"]) == (0.0, 5.0)
+    assert agent.calls == 2
+
+async def test_non_string_keys_are_not_memoized(orchestrator, agent):
+    """Test data that JSON would coerce to the same key is not memoized"""
+    await orchestrator.execute_task(agent, make_task("t1", x={1: "a"}))
+    await orchestrator.execute_task(agent, make_task("t2", x={"1": "a"}))
+
+    assert agent.calls == 2
+
+async def test_failed_results_are_not_memoized(orchestrator):
+    """Test only successful results are reused"""
+    agent = CountingAgent(status="error")
+    await orchestrator.execute_task(agent, make_task("t1"))
+    await orchestrator.execute_task(agent, make_task("t2"))
+
+    assert agent.calls == 2
+
+async def test_clear_memo(orchestrator, agent):
+    """Test clearing the memo forces re-execution"""
+    await orchestrator.execute_task(agent, make_task("t1"))
+    orchestrator.clear_memo()
+    await orchestrator.execute_task(agent, make_task("t2"))
+
+    assert agent.calls == 2
+
+async def test_memo_evicts_least_recently_used(orchestrator, agent):
+    """Test the memo keeps at most MEMO_MAX_ENTRIES results"""
+    orchestrator.MEMO_MAX_ENTRIES = 2
+    await orchestrator.execute_task(agent, make_task("a", x=1))
+    await orchestrator.execute_task(agent, make_task("b", x=2))
+    await orchestrator.execute_task(agent, make_task("a2", x=1))  # refresh x=1
+    await orchestrator.execute_task(agent, make_task("c", x=3))   # evicts x=2
+    assert agent.calls == 3
+
+    await orchestrator.execute_task(agent, make_task("a3", x=1))
+    assert agent.calls == 3
+
+    await orchestrator.execute_task(agent, make_task("b2", x=2))
+    assert agent.calls == 4
+
+async def test_memo_ttl_expires_entries(orchestrator, agent):
+    """Test memoized results older than MEMO_TTL are recomputed"""
+    orchestrator.MEMO_TTL = 10.0
+    await orchestrator.execute_task(agent, make_task("t1"))
+    await orchestrator.execute_task(agent, make_task("t2"))
+    assert agent.calls == 1
+
+    # Age the stored entry past the TTL
+    for key, (result, stored_at) in list(orchestrator._result_cache.items()):
+        orchestrator._result_cache[key] = (result, stored_at - 11.0)
+
+    await orchestrator.execute_task(agent, make_task("t3"))
+    assert agent.calls == 2
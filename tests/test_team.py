@@ -0,0 +1,45 @@
+"""Tests for Team functionality"""
+
+import asyncio
+import pytest
+from graphfusionai.team import Team
+
+class StubAgent:
+    """Agent stand-in that records its cleanup"""
+
+    def __init__(self, name, delay=0.0, error=None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.cleaned_up = False
+
+    async def cleanup(self):
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        self.cleaned_up = True
+
+async def test_cleanup_awaits_all_members():
+    """Test cleanup tears down every member and clears the team"""
+    team = Team("test_team")
+    members = [StubAgent("a", delay=0.01), StubAgent("b")]
+    for agent in members:
+        team.add_member(agent.name, agent)
+
+    await team.cleanup()
+
+    assert all(agent.cleaned_up for agent in members)
+    assert team.members == {}
+
+async def test_cleanup_failure_waits_for_other_members():
+    """Test a failing member cleanup is raised only after the rest finish"""
+    team = Team("test_team")
+    slow = StubAgent("slow", delay=0.05)
+    team.add_member("failing", StubAgent("failing", error=RuntimeError("boom")))
+    team.add_member("slow", slow)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await team.cleanup()
+
+    assert slow.cleaned_up
+    assert team.members == {}
@@ -0,0 +1,63 @@
+"""Tests for ToolRegistry functionality"""
+
+import pytest
+from graphfusionai.tools import Tool, ToolRegistry
+
+def make_tool(name, tags, enabled=True):
+    tool = Tool.create(name=name, description=f"{name} tool", handler=lambda: name, tags=tags)
+    tool.enabled = enabled
+    return tool
+
+def names(tools):
+    return [tool.metadata.name for tool in tools]
+
+@pytest.fixture
+def registry():
+    registry = ToolRegistry()
+    registry.register(make_tool("search", ["web", "read"]))
+    registry.register(make_tool("fetch", ["web"]))
+    registry.register(make_tool("write", ["disk"]))
+    return registry
+
+def test_register_and_list_by_tags(registry):
+    """Test registered tools are listed and filtered by any matching tag"""
+    assert names(registry.list_tools()) == ["search", "fetch", "write"]
+    assert names(registry.list_tools(["web"])) == ["search", "fetch"]
+    assert names(registry.list_tools(["disk", "read"])) == ["search", "write"]
+    assert registry.list_tools(["missing"]) == []
+
+    with pytest.raises(ValueError):
+        registry.register(make_tool("fetch", ["web"]))
+
+def test_unregister(registry):
+    """Test unregistered tools are no longer listed"""
+    registry.unregister("fetch")
+
+    assert registry.get_tool("fetch") is None
+    assert names(registry.list_tools(["web"])) == ["search"]
+
+def test_disable_and_enable(registry):
+    """Test disabled tools are hidden until enabled again"""
+    assert registry.disable_tool("search")
+    assert names(registry.list_tools(["web"])) == ["fetch"]
+    assert not registry.disable_tool("search")
+
+    assert registry.enable_tool("search")
+    assert names(registry.list_tools(["web"])) == ["fetch", "search"]
+    assert not registry.enable_tool("search")
+
+def test_enable_replaces_tool_with_same_name():
+    """Test enabling a disabled tool replaces an enabled one of the same name"""
+    registry = ToolRegistry()
+    registry.register(make_tool("x", ["a"], enabled=False))
+    registry.register(make_tool("x", ["b"]))
+
+    assert registry.enable_tool("x")
+    assert names(registry.list_tools(["a"])) == ["x"]
+    assert registry.list_tools(["b"]) == []
+
+def test_tag_changes_after_registration_are_seen(registry):
+    """Test tag filtering reads each tool's current tags"""
+    registry.get_tool("write").metadata.tags.append("web")
+
+    assert names(registry.list_tools(["web"])) == ["search", "fetch", "write"]